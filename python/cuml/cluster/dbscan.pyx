@@ -113,6 +113,8 @@ class DBSCAN(Base):
         pairwise distance computation. This enables the trade-off between
         runtime and memory usage for making the N^2 pairwise distance
         computations more tractable for large numbers of samples.
+        If None, half of the memory free on the device when fit is called
+        is used.
         If you are experiencing out of memory errors when running DBSCAN, you
         can set this value based on the memory size of your device.
         Note: this option does not set the maximum total memory used in the
@@ -156,10 +158,6 @@ class DBSCAN(Base):
         self.max_bytes_per_batch = max_bytes_per_batch
         self.verbose = verbose
 
-        # C++ API expects this to be numeric.
-        if self.max_bytes_per_batch is None:
-            self.max_bytes_per_batch = 0
-
     def __getattr__(self, attr):
         if attr == 'labels_array':
             return self.labels_._column._data.mem
@@ -201,6 +199,16 @@ class DBSCAN(Base):
         self.labels_ = cudf.Series(np.zeros(self.n_rows, dtype=np.int32))
         cdef uintptr_t labels_ptr = self._get_cudf_column_ptr(self.labels_)
 
+        cdef size_t max_bytes_per_batch
+        if self.max_bytes_per_batch is None:
+            # size the batches from the memory actually free on this device
+            # rather than the fixed default in the C++ layer, which can
+            # exhaust small GPUs and batch needlessly on large ones
+            free_mem, _ = cuda.current_context().get_memory_info()
+            max_bytes_per_batch = free_mem // 2
+        else:
+            max_bytes_per_batch = self.max_bytes_per_batch
+
         if self.gdf_datatype.type == np.float32:
             dbscanFit(handle_[0],
                       <float*>input_ptr,
@@ -209,7 +217,7 @@ class DBSCAN(Base):
                       <float> self.eps,
                       <int> self.min_samples,
                       <int*> labels_ptr,
-                      <size_t>self.max_bytes_per_batch,
+                      <size_t> max_bytes_per_batch,
                       <bool>self.verbose)
         else:
             dbscanFit(handle_[0],
@@ -219,7 +227,7 @@ class DBSCAN(Base):
                       <double> self.eps,
                       <int> self.min_samples,
                       <int*> labels_ptr,
-                      <size_t> self.max_bytes_per_batch,
+                      <size_t> max_bytes_per_batch,
                       <bool>self.verbose)
         # make sure that the `dbscanFit` is complete before the following
         # delete call happens
@@ -24,9 +24,10 @@ import cudf
 import numpy as np
 import warnings
 
-from numba import cuda
 from cuml import numba_utils
 
+from librmm_cffi import librmm as rmm
+
 from libcpp cimport bool
 from libc.stdint cimport uintptr_t
 from libc.stdlib cimport calloc, malloc, free
@@ -290,41 +291,68 @@ class KMeans(Base):
         self.tol = tol
         self.labels_ = None
         self.cluster_centers_ = None
+        self._cluster_centers_mat = None
         self.n_gpu = n_gpu
 
-    def fit(self, X):
+    def _input_to_dev_array(self, X):
         """
-        Compute k-means clustering with X.
-
-        Parameters
-        ----------
-        X : cuDF DataFrame
-            Dense matrix (floats or doubles) of shape (n_samples, n_features)
-
+        Convert X to a row-major device array and record its dtype and
+        shape on the estimator. Unsupported inputs are rejected before
+        any conversion or device allocation happens.
         """
-
-        cdef uintptr_t input_ptr
         if (isinstance(X, cudf.DataFrame)):
             self.gdf_datatype = np.dtype(X[X.columns[0]]._column.dtype)
-            X_m = numba_utils.row_matrix(X)
             self.n_rows = len(X)
             self.n_cols = len(X._cols)
 
         elif (isinstance(X, np.ndarray)):
             self.gdf_datatype = X.dtype
-            X_m = cuda.to_device(X)
             self.n_rows = X.shape[0]
             self.n_cols = X.shape[1]
 
         else:
-            msg = "X matrix format  not supported"
+            msg = "X matrix format not supported"
             raise TypeError(msg)
 
+        if self.gdf_datatype.type not in [np.float32, np.float64]:
+            raise TypeError('KMeans supports only float32 and float64 input,'
+                            'but input type ' + str(self.gdf_datatype.type) +
+                            ' passed.')
+
+        if (isinstance(X, cudf.DataFrame)):
+            X_m = numba_utils.row_matrix(X)
+        else:
+            X_m = rmm.to_device(X)
+
+        return X_m
+
+    def fit(self, X):
+        """
+        Compute k-means clustering with X.
+
+        Parameters
+        ----------
+        X : cuDF DataFrame
+            Dense matrix (floats or doubles) of shape (n_samples, n_features)
+
+        """
+        X_m = self._input_to_dev_array(X)
+        self._fit(X_m)
+        del(X_m)
+        return self
+
+    def _fit(self, X_m):
+        """
+        Fit on an input that is already a row-major device array.
+        """
+
+        cdef uintptr_t input_ptr
         input_ptr = self._get_dev_array_ptr(X_m)
 
         cdef cumlHandle* handle_ = <cumlHandle*><size_t>self.handle.getHandle()
 
-        self.labels_ = cudf.Series(np.zeros(self.n_rows, dtype=np.int32))
+        self.labels_ = cudf.Series(rmm.device_array(self.n_rows,
+                                                    dtype=np.int32))
         cdef uintptr_t labels_ptr = self._get_cudf_column_ptr(self.labels_)
 
         if (isinstance(self.init, cudf.DataFrame)):
@@ -333,11 +361,9 @@ class KMeans(Base):
                                  'does not match the number of clusters %i'
                                  % (self.init.shape, self.n_clusters))
             init_value = Array
-            self.cluster_centers_ = cuda.device_array(
-                                           self.n_clusters * self.n_cols,
-                                           dtype=self.gdf_datatype)
-            self.cluster_centers_.copy_to_device(
-                                    numba_utils.row_matrix(self.init))
+            # row_matrix already returns a fresh row-major device array,
+            # so use it directly instead of copying it into a second buffer
+            self.cluster_centers_ = numba_utils.row_matrix(self.init).ravel()
 
         elif (isinstance(self.init, np.ndarray)):
             if(self.init.shape[0] != self.n_clusters):
@@ -345,19 +371,21 @@ class KMeans(Base):
                                  'does not match the number of clusters %i'
                                  % (self.init.shape, self.n_clusters))
             init_value = Array
-            self.cluster_centers_ = cuda.to_device(self.init.flatten())
+            # ravel instead of flatten: no host-side copy when the initial
+            # centers are already contiguous
+            self.cluster_centers_ = rmm.to_device(np.ravel(self.init))
 
         elif (self.init in ['scalable-k-means++', 'k-means||']):
             init_value = KMeansPlusPlus
-            clust_cent = np.zeros(self.n_clusters * self.n_cols,
-                                  dtype=self.gdf_datatype)
-            self.cluster_centers_ = cuda.to_device(clust_cent)
+            self.cluster_centers_ = rmm.device_array(
+                                           self.n_clusters * self.n_cols,
+                                           dtype=self.gdf_datatype)
 
         elif (self.init == 'random'):
             init_value = Random
-            clust_cent = np.zeros(self.n_clusters * self.n_cols,
-                                  dtype=self.gdf_datatype)
-            self.cluster_centers_ = cuda.to_device(clust_cent)
+            self.cluster_centers_ = rmm.device_array(
+                                           self.n_clusters * self.n_cols,
+                                           dtype=self.gdf_datatype)
 
         else:
             raise TypeError('initialization method not supported')
@@ -396,21 +424,17 @@ class KMeans(Base):
                 <double*> cluster_centers_ptr, # pred_centroids);
                 <int*> labels_ptr,             # pred_labels
                 <int> self.verbose)
-        else:
-            raise TypeError('KMeans supports only float32 and float64 input,'
-                            'but input type ' + str(self.gdf_datatype.type) +
-                            ' passed.')
 
         self.handle.sync()
+        # keep the row-major device copy of the centroids around so that
+        # predict/transform do not have to rebuild it from the dataframe
+        self._cluster_centers_mat = self.cluster_centers_
+        n_elts = self.n_clusters * self.n_cols
         cluster_centers_gdf = cudf.DataFrame()
         for i in range(0, self.n_cols):
-            cluster_centers_gdf[str(i)] = self.cluster_centers_[i:self.n_clusters*self.n_cols:self.n_cols] # noqa
+            cluster_centers_gdf[str(i)] = self.cluster_centers_[i:n_elts:self.n_cols]  # noqa: E501
         self.cluster_centers_ = cluster_centers_gdf
 
-        del(X_m)
-
-        return self
-
     def fit_predict(self, X):
         """
         Compute cluster centers and predict cluster index for each sample.
@@ -437,29 +461,17 @@ class KMeans(Base):
         """
 
         cdef uintptr_t input_ptr
-        if (isinstance(X, cudf.DataFrame)):
-            self.gdf_datatype = np.dtype(X[X.columns[0]]._column.dtype)
-            X_m = numba_utils.row_matrix(X)
-            self.n_rows = len(X)
-            self.n_cols = len(X._cols)
-
-        elif (isinstance(X, np.ndarray)):
-            self.gdf_datatype = X.dtype
-            X_m = cuda.to_device(X)
-            self.n_rows = X.shape[0]
-            self.n_cols = X.shape[1]
-
-        else:
-            msg = "X matrix format not supported"
-            raise TypeError(msg)
-
+        X_m = self._input_to_dev_array(X)
         input_ptr = self._get_dev_array_ptr(X_m)
 
         cdef cumlHandle* handle_ = <cumlHandle*><size_t>self.handle.getHandle()
-        clust_mat = numba_utils.row_matrix(self.cluster_centers_)
+        clust_mat = self._cluster_centers_mat
+        if clust_mat is None:
+            clust_mat = numba_utils.row_matrix(self.cluster_centers_)
         cdef uintptr_t cluster_centers_ptr = self._get_dev_array_ptr(clust_mat)
 
-        self.labels_ = cudf.Series(np.zeros(self.n_rows, dtype=np.int32))
+        self.labels_ = cudf.Series(rmm.device_array(self.n_rows,
+                                                    dtype=np.int32))
         cdef uintptr_t labels_ptr = self._get_cudf_column_ptr(self.labels_)
 
         if self.gdf_datatype.type == np.float32:
@@ -484,10 +496,6 @@ class KMeans(Base):
                 <int> 0,                       # distance metric as squared L2: @todo - support other metrics # noqa: E501
                 <int*> labels_ptr,             # pred_labels
                 <int> self.verbose)
-        else:
-            raise TypeError('KMeans supports only float32 and float64 input,'
-                            'but input type ' + str(self.gdf_datatype.type) +
-                            ' passed.')
 
         self.handle.sync()
         del(X_m)
@@ -505,32 +513,27 @@ class KMeans(Base):
                     (n_samples, n_features)
 
         """
+        X_m = self._input_to_dev_array(X)
+        preds_gdf = self._transform(X_m)
+        del(X_m)
+        return preds_gdf
 
-        cdef uintptr_t input_ptr
-        if (isinstance(X, cudf.DataFrame)):
-            self.gdf_datatype = np.dtype(X[X.columns[0]]._column.dtype)
-            X_m = numba_utils.row_matrix(X)
-            self.n_rows = len(X)
-            self.n_cols = len(X._cols)
-
-        elif (isinstance(X, np.ndarray)):
-            self.gdf_datatype = X.dtype
-            X_m = cuda.to_device(X)
-            self.n_rows = X.shape[0]
-            self.n_cols = X.shape[1]
-
-        else:
-            msg = "X matrix format  not supported"
-            raise TypeError(msg)
+    def _transform(self, X_m):
+        """
+        Transform an input that is already a row-major device array.
+        """
 
+        cdef uintptr_t input_ptr
         input_ptr = self._get_dev_array_ptr(X_m)
 
         cdef cumlHandle* handle_ = <cumlHandle*><size_t>self.handle.getHandle()
-        clust_mat = numba_utils.row_matrix(self.cluster_centers_)
+        clust_mat = self._cluster_centers_mat
+        if clust_mat is None:
+            clust_mat = numba_utils.row_matrix(self.cluster_centers_)
         cdef uintptr_t cluster_centers_ptr = self._get_dev_array_ptr(clust_mat)
 
-        preds_data = cuda.to_device(np.zeros(self.n_clusters*self.n_rows,
-                                    dtype=self.gdf_datatype.type))
+        preds_data = rmm.device_array(self.n_clusters * self.n_rows,
+                                      dtype=self.gdf_datatype.type)
 
         cdef uintptr_t preds_ptr = self._get_dev_array_ptr(preds_data)
 
@@ -556,17 +559,13 @@ class KMeans(Base):
                 <int> 1,                        # distance metric as L2-norm/euclidean distance: @todo - support other metrics # noqa: E501
                 <double*> preds_ptr,            # transformed output
                 <int> self.verbose)
-        else:
-            raise TypeError('KMeans supports only float32 and float64 input,'
-                            'but input type ' + str(self.gdf_datatype.type) +
-                            ' passed.')
 
         self.handle.sync()
+        n_elts = self.n_rows * self.n_clusters
         preds_gdf = cudf.DataFrame()
         for i in range(0, self.n_clusters):
-            preds_gdf[str(i)] = preds_data[i:self.n_rows * self.n_clusters:self.n_clusters]  # noqa: E501
+            preds_gdf[str(i)] = preds_data[i:n_elts:self.n_clusters]
 
-        del(X_m)
         del(clust_mat)
         return preds_gdf
 
@@ -581,7 +580,13 @@ class KMeans(Base):
                     (n_samples, n_features)
 
         """
-        return self.fit(input_gdf).transform(input_gdf)
+        # convert the input once and share the device array between the
+        # fit and transform passes
+        X_m = self._input_to_dev_array(input_gdf)
+        self._fit(X_m)
+        preds_gdf = self._transform(X_m)
+        del(X_m)
+        return preds_gdf
 
     def get_params(self, deep=True):
         """
@@ -21,6 +21,50 @@ from numba.cuda.cudadrv.driver import driver
 from librmm_cffi import librmm as rmm
 
 
+# cache of the compiled transpose kernels, keyed by dtype and tile shape:
+# defining them inside row_matrix made numba JIT-compile them again on
+# every call
+_row_matrix_kernels = {}
+
+
+def _get_row_matrix_kernels(dev_dtype, tile_shape):
+    key = (dev_dtype, tile_shape)
+    if key not in _row_matrix_kernels:
+
+        @cuda.jit
+        def general_kernel(_col_major, _row_major):
+            tid = cuda.blockIdx.x * cuda.blockDim.x + cuda.threadIdx.x
+            if tid >= _col_major.shape[0]:
+                return
+            _col_offset = 0
+            while _col_offset < _col_major.shape[1]:
+                col_idx = _col_offset
+                _row_major[tid, col_idx] = _col_major[tid, col_idx]
+                _col_offset += 1
+
+        @cuda.jit
+        def shared_kernel(input, output):
+
+            tile = cuda.shared.array(shape=tile_shape, dtype=dev_dtype)
+
+            tx = cuda.threadIdx.x
+            ty = cuda.threadIdx.y
+            bx = cuda.blockIdx.x * cuda.blockDim.x
+            by = cuda.blockIdx.y * cuda.blockDim.y
+            y = by + tx
+            x = bx + ty
+
+            if by + ty < input.shape[0] and bx + tx < input.shape[1]:
+                tile[ty, tx] = input[by + ty, bx + tx]
+            cuda.syncthreads()
+            if y < output.shape[0] and x < output.shape[1]:
+                output[y, x] = tile[tx, ty]
+
+        _row_matrix_kernels[key] = (general_kernel, shared_kernel)
+
+    return _row_matrix_kernels[key]
+
+
 def row_matrix(df):
     """Compute the C (row major) version gpu matrix of df
 
@@ -59,34 +103,8 @@ def row_matrix(df):
     else:
         dev_dtype = numba.float64
 
-    @cuda.jit
-    def general_kernel(_col_major, _row_major):
-        tid = cuda.blockIdx.x * cuda.blockDim.x + cuda.threadIdx.x
-        if tid >= nrows:
-            return
-        _col_offset = 0
-        while _col_offset < _col_major.shape[1]:
-            col_idx = _col_offset
-            _row_major[tid, col_idx] = _col_major[tid, col_idx]
-            _col_offset += 1
-
-    @cuda.jit
-    def shared_kernel(input, output):
-
-        tile = cuda.shared.array(shape=tile_shape, dtype=dev_dtype)
-
-        tx = cuda.threadIdx.x
-        ty = cuda.threadIdx.y
-        bx = cuda.blockIdx.x * cuda.blockDim.x
-        by = cuda.blockIdx.y * cuda.blockDim.y
-        y = by + tx
-        x = bx + ty
-
-        if by + ty < input.shape[0] and bx + tx < input.shape[1]:
-            tile[ty, tx] = input[by + ty, bx + tx]
-        cuda.syncthreads()
-        if y < output.shape[0] and x < output.shape[1]:
-            output[y, x] = tile[tx, ty]
+    general_kernel, shared_kernel = _get_row_matrix_kernels(dev_dtype,
+                                                            tile_shape)
 
     # check if we cannot call the shared memory kernel
     # block limits: 2**31-1 for x, 65535 for y dim of blocks
@@ -54,8 +54,9 @@ def test_dbscan_predict(datatype, input_type, use_handle, max_bytes_per_batch):
         cu_labels = cudbscan.fit_predict(X)
     cudbscan.handle.sync()
 
-    for i in range(X.shape[0]):
-        assert cu_labels[i] == sk_labels[i]
+    # compare the whole label arrays at once instead of pulling the
+    # labels off the device one element at a time
+    assert np.array_equal(cu_labels.to_array(), sk_labels)
 
 
 @pytest.mark.parametrize('datatype', [np.float32, np.float64])
@@ -76,8 +77,7 @@ def test_dbscan_predict_numpy(datatype, use_handle):
     sk_labels = skdbscan.fit_predict(X)
     print(X.shape[0])
     cudbscan.handle.sync()
-    for i in range(X.shape[0]):
-        assert cu_labels[i] == sk_labels[i]
+    assert np.array_equal(cu_labels.to_array(), sk_labels)
 
 
 def test_dbscan_predict_multiple_streams():
@@ -100,9 +100,8 @@ def test_dbscan_predict_multiple_streams():
     cu_labels2 = cudbscan2.fit_predict(gdf)
     cudbscan1.handle.sync()
     cudbscan2.handle.sync()
-    for i in range(X.shape[0]):
-        assert cu_labels1[i] == sk_labels[i]
-        assert cu_labels2[i] == sk_labels[i]
+    assert np.array_equal(cu_labels1.to_array(), sk_labels)
+    assert np.array_equal(cu_labels2.to_array(), sk_labels)
 
 
 @pytest.mark.parametrize("name", [
@@ -119,9 +119,11 @@ def test_linear_kalman_filter(precision, dim_x, dim_z, input_type):
     for i in range(n):
         f.predict()
 
-        z = i*np.ones(dim_z, dtype=dt)
+        # build the constant measurement vector in one fill and without
+        # the redundant np.array copy before the device transfer
+        z = np.full(dim_z, i, dtype=dt)
 
-        f.update(cuda.to_device(np.array(z, dtype=dt)))
+        f.update(cuda.to_device(z))
         x = f.x.copy_to_host()
         rmse_x = rmse_x + ((x[0] - i)**2)
         rmse_v = rmse_v + ((x[1] - 1)**2)
@@ -40,9 +40,9 @@ def to_nparray(x):
     elif isinstance(x, pd.DataFrame):
         return x.values
     elif isinstance(x, cudf.DataFrame):
-        return x.to_pandas().values
+        return x.as_matrix()
     elif isinstance(x, cudf.Series):
-        return x.to_pandas().values
+        return x.to_array()
     return np.array(x)
 
 
@@ -101,7 +101,7 @@ def fit_predict(algorithm, name, X):
     else:
         df = np_to_cudf(X)
         algorithm.fit(df)
-        y_pred = algorithm.labels_.to_pandas().values.astype(np.int)
+        y_pred = algorithm.labels_.to_array().astype(np.int)
 
     n_clusters = len(set(y_pred)) - (1 if -1 in y_pred else 0)
     return y_pred, n_clusters
@@ -113,9 +113,13 @@ def normalize_clusters(a0, b0, n_clusters):
 
     c = deepcopy(b)
 
+    # find the first occurrence of every label in one pass instead of
+    # scanning the whole array once per cluster
+    labels, first_idx = np.unique(a, return_index=True)
+    first_occurrence = dict(zip(labels, first_idx))
+
     for i in range(n_clusters):
-        idx, = np.where(a == i)
-        a_to_b = c[idx[0]]
+        a_to_b = c[first_occurrence[i]]
         b[c == a_to_b] = i
 
     return a, b